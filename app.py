@@ -1,14 +1,10 @@
 """Main Streamlit application for Family Football Pool."""
 
-from typing import TYPE_CHECKING
-
 import streamlit as st
 
-if TYPE_CHECKING:
-    from supabase import Client
-
 from family_huddle.pages import auth, home, leaderboard, pools, team_selection
-from family_huddle.services.database import create_client
+from family_huddle.services.database import get_client
+from family_huddle.services.queries import load_profiles
 
 # Load environment variables for local development
 try:
@@ -27,14 +23,15 @@ st.set_page_config(
 )
 
 
-@st.cache_resource
-def init_database() -> "Client":
-    """Initialize and cache the Supabase database client.
+# Profiles beyond this many are reachable through the sidebar search box
+MAX_PROFILE_OPTIONS = 50
 
-    Returns:
-        Client: Cached Supabase client instance for database operations.
-    """
-    return create_client()
+_SESSION_DEFAULTS = {
+    "authenticated": False,
+    "user_id": None,
+    "current_profile": None,
+    "user_email": None,
+}
 
 
 def init_session_state() -> None:
@@ -43,14 +40,8 @@ def init_session_state() -> None:
     Sets up session state for authentication, user ID, current profile,
     and user email if not already present.
     """
-    if "authenticated" not in st.session_state:
-        st.session_state.authenticated = False
-    if "user_id" not in st.session_state:
-        st.session_state.user_id = None
-    if "current_profile" not in st.session_state:
-        st.session_state.current_profile = None
-    if "user_email" not in st.session_state:
-        st.session_state.user_email = None
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
 
 def main() -> None:
@@ -60,7 +51,7 @@ def main() -> None:
     and page routing based on user selections.
     """
     init_session_state()
-    db = init_database()
+    db = get_client()
 
     if not st.session_state.authenticated:
         auth.show_login(db)
@@ -69,25 +60,35 @@ def main() -> None:
     st.sidebar.title("🏈 Family Huddle")
     st.sidebar.markdown(f"**User:** {st.session_state.user_email}")
 
-    if st.session_state.authenticated:
-        profiles = (
-            db.table("profiles").select("*").eq("user_id", st.session_state.user_id).execute()
+    profiles = load_profiles(db, st.session_state.user_id)
+
+    if len(profiles) == 1:
+        # Nothing to choose between, so skip the selector widget
+        st.session_state.current_profile = profiles[0]
+        st.sidebar.markdown(f"**Profile:** {profiles[0]['profile_name']}")
+    elif profiles:
+        profiles_by_name = {p["profile_name"]: p for p in profiles}
+        profile_names = list(profiles_by_name)
+        current_name = (
+            st.session_state.current_profile["profile_name"]
+            if st.session_state.current_profile
+            else None
+        )
+
+        if len(profile_names) > MAX_PROFILE_OPTIONS:
+            search = st.sidebar.text_input("Search profiles:").strip().lower()
+            matches = [n for n in profile_names if search in n.lower()]
+            profile_names = (matches or profile_names)[:MAX_PROFILE_OPTIONS]
+            if current_name in profiles_by_name and current_name not in profile_names:
+                profile_names.insert(0, current_name)
+
+        selected_profile = st.sidebar.selectbox(
+            "Active Profile:",
+            options=profile_names,
+            index=profile_names.index(current_name) if current_name in profile_names else 0,
         )
 
-        if profiles.data:
-            profile_names = [p["profile_name"] for p in profiles.data]
-            selected_profile = st.sidebar.selectbox(
-                "Active Profile:",
-                options=profile_names,
-                index=0
-                if not st.session_state.current_profile
-                else profile_names.index(st.session_state.current_profile["profile_name"]),
-            )
-
-            for profile in profiles.data:
-                if profile["profile_name"] == selected_profile:
-                    st.session_state.current_profile = profile
-                    break
+        st.session_state.current_profile = profiles_by_name[selected_profile]
 
     st.sidebar.divider()
 
@@ -1,23 +1,28 @@
 #!/usr/bin/env python3
 """Initialize local database with NFL teams and sample data."""
 
+import functools
+import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 if TYPE_CHECKING:
     from supabase import Client
 
-import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 from family_huddle.services.database import create_admin_client
-from family_huddle.services.nfl_data import nfl_data
+from family_huddle.services.nfl_data import seed_nfl_teams
 
 
-def init_nfl_teams(db: "Client") -> None:
+def init_nfl_teams(db: "Client") -> list[dict[str, Any]]:
     """Initialize NFL teams data in the database.
 
     Loads team data from the mock NFL data service and inserts all teams
@@ -25,24 +30,16 @@ def init_nfl_teams(db: "Client") -> None:
 
     Args:
         db: Supabase client for database operations.
+
+    Returns:
+        list[dict[str, Any]]: The inserted team rows, including their team_id.
     """
     print("Initializing NFL teams...")
 
-    teams_df = nfl_data.import_teams()
-
-    for _, team in teams_df.iterrows():
-        team_data = {
-            "team_code": team["team_code"],
-            "team_name": team["team_name"],
-            "team_city": team["team_city"],
-            "conference": team["conference"],
-            "division": team["division"],
-            "points": team.get("points", 5),  # Default to 5 points if not specified
-            "is_active": True,
-        }
-        db.table("nfl_teams").insert(team_data).execute()
+    teams = seed_nfl_teams(db)
 
-    print(f"✅ Loaded {len(teams_df)} NFL teams")
+    print(f"✅ Loaded {len(teams)} NFL teams")
+    return teams
 
 
 def init_seasons_and_weeks(db: "Client") -> str:
@@ -69,24 +66,31 @@ def init_seasons_and_weeks(db: "Client") -> str:
     # Create weeks
     season_start = datetime(current_year, 9, 7)  # First Thursday of September
 
-    for week_num in range(1, 19):
-        week_start = season_start + timedelta(weeks=week_num - 1)
-        week_end = week_start + timedelta(days=6)
+    week_starts = pd.date_range(season_start, periods=18, freq="7D")
+    week_ends = week_starts + pd.Timedelta(days=6)
 
-        week_data = {
+    weeks_data = [
+        {
             "season_id": season_id,
             "week_number": week_num,
             "week_type": "Regular",
-            "start_date": week_start.date().isoformat(),
-            "end_date": week_end.date().isoformat(),
+            "start_date": start_date,
+            "end_date": end_date,
         }
-        db.table("nfl_weeks").insert(week_data).execute()
+        for week_num, start_date, end_date in zip(
+            range(1, 19),
+            week_starts.strftime("%Y-%m-%d"),
+            week_ends.strftime("%Y-%m-%d"),
+            strict=True,
+        )
+    ]
+    db.table("nfl_weeks").insert(weeks_data).execute()
 
     print(f"✅ Created season {current_year} with 18 weeks")
     return season_id
 
 
-def init_team_performance(db: "Client", season_id: str) -> None:
+def init_team_performance(db: "Client", season_id: str, teams: list[dict[str, Any]]) -> None:
     """Initialize mock team performance data for the season.
 
     Generates random wins/losses records and performance metrics
@@ -95,33 +99,63 @@ def init_team_performance(db: "Client", season_id: str) -> None:
     Args:
         db: Supabase client for database operations.
         season_id: The season ID to associate performance data with.
+        teams: Team rows returned by init_nfl_teams.
     """
     print("Initializing team performance...")
 
-    teams = db.table("nfl_teams").select("*").execute().data
+    # Generate random performance
+    wins = np.random.default_rng().integers(3, 15, size=len(teams))
+    playoff_made = wins >= 10
+    win_percentage = np.round(wins / 17, 3)
+    performance_score = np.round(wins * 5.88 + np.where(playoff_made, 15, 0), 3)
 
-    for team in teams:
-        # Generate random performance
-        wins = random.randint(3, 14)
-        losses = 17 - wins
-
-        perf_data = {
+    perf_data = [
+        {
             "team_id": team["team_id"],
             "season_id": season_id,
             "games_played": 17,
-            "wins": wins,
-            "losses": losses,
+            "wins": team_wins,
+            "losses": 17 - team_wins,
             "ties": 0,
-            "win_percentage": round(wins / 17, 3),
-            "playoff_made": wins >= 10,
-            "performance_score": round(wins * 5.88 + (15 if wins >= 10 else 0), 3),
+            "win_percentage": team_win_pct,
+            "playoff_made": team_playoff,
+            "performance_score": team_score,
         }
-        db.table("team_performance").insert(perf_data).execute()
+        for team, team_wins, team_win_pct, team_playoff, team_score in zip(
+            teams,
+            wins.tolist(),
+            win_percentage.tolist(),
+            playoff_made.tolist(),
+            performance_score.tolist(),
+            strict=True,
+        )
+    ]
+    db.table("team_performance").insert(perf_data).execute()
 
     print("✅ Generated team performance data")
 
 
-def init_sample_users(db: "Client") -> None:
+@functools.cache
+def _seed_password_hash() -> str:
+    """Return the password hash shared by every seed account.
+
+    The hash is computed once per process and reused for all sample users.
+    Set FAMILY_HUDDLE_SEED_HASH to a precomputed hash of 'password' to skip
+    hashing entirely (e.g. in CI).
+
+    Returns:
+        str: Password hash for the seed accounts.
+    """
+    seed_hash = os.getenv("FAMILY_HUDDLE_SEED_HASH")
+    if seed_hash:
+        return seed_hash
+
+    from family_huddle.pages.auth import hash_password
+
+    return hash_password("password")
+
+
+def init_sample_users(db: "Client") -> list[dict[str, Any]]:
     """Create sample user accounts for testing purposes.
 
     Creates test user accounts with default password 'password' and
@@ -129,48 +163,40 @@ def init_sample_users(db: "Client") -> None:
 
     Args:
         db: Supabase client for database operations.
+
+    Returns:
+        list[dict[str, Any]]: The created users' user_id and profile_id.
     """
     print("Creating sample users...")
 
     # Password is 'password' for all test users
-    from family_huddle.pages.auth import hash_password
-
-    test_password = hash_password("password")
+    test_password = _seed_password_hash()
 
     test_users = [
-        {
-            "email": "test@example.com",
-            "password_hash": test_password,
-            "first_name": "Test",
-            "last_name": "User",
-            "is_active": True,
-            "email_verified": True,
-        },
-        {
-            "email": "john@example.com",
-            "password_hash": test_password,
-            "first_name": "John",
-            "last_name": "Doe",
-            "is_active": True,
-            "email_verified": True,
-        },
+        {"email": "test@example.com", "first_name": "Test", "last_name": "User"},
+        {"email": "john@example.com", "first_name": "John", "last_name": "Doe"},
     ]
 
+    # signup_user creates each user and its default profile in a single round trip
+    users = []
     for user_data in test_users:
-        result = db.table("users").insert(user_data).execute()
-
-        # Create default profile with first and last name
-        profile_data = {
-            "user_id": result.data[0]["user_id"],
-            "profile_name": f"{user_data['first_name']} {user_data['last_name']}",
-            "display_name": f"{user_data['first_name']} {user_data['last_name']}",
-        }
-        db.table("profiles").insert(profile_data).execute()
+        result = db.rpc(
+            "signup_user",
+            {
+                "p_email": user_data["email"],
+                "p_password_hash": test_password,
+                "p_first_name": user_data["first_name"],
+                "p_last_name": user_data["last_name"],
+                "p_email_verified": True,
+            },
+        ).execute()
+        users.extend(result.data)
 
     print("✅ Created sample users (password: 'password')")
+    return users
 
 
-def init_sample_pool(db: "Client") -> None:
+def init_sample_pool(db: "Client", users: list[dict[str, Any]]) -> None:
     """Create a sample football pool for testing.
 
     Creates a default family pool for the current year with standard
@@ -178,10 +204,10 @@ def init_sample_pool(db: "Client") -> None:
 
     Args:
         db: Supabase client for database operations.
+        users: User rows returned by init_sample_users; the first one owns the pool.
     """
     print("Creating sample pool...")
 
-    users = db.table("users").select("*").execute().data
     if users:
         pool_data = {
             "pool_name": "Family Pool 2024",
@@ -198,6 +224,28 @@ def init_sample_pool(db: "Client") -> None:
         print("✅ Created sample pool")
 
 
+def init_all(db: "Client") -> None:
+    """Run every initialization step, overlapping the independent ones.
+
+    Teams, seasons, and users have no data dependency on each other, so their
+    requests run concurrently. Team performance waits on the teams and season
+    rows, and the sample pool waits on the users.
+
+    Args:
+        db: Supabase client for database operations.
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        teams_future = executor.submit(init_nfl_teams, db)
+        users_future = executor.submit(init_sample_users, db)
+        season_id = init_seasons_and_weeks(db)
+
+        performance_future = executor.submit(
+            init_team_performance, db, season_id, teams_future.result()
+        )
+        init_sample_pool(db, users_future.result())
+        performance_future.result()
+
+
 def main() -> None:
     """Main data initialization function.
 
@@ -210,7 +258,9 @@ def main() -> None:
 
     db = create_admin_client()
 
-    existing_teams = db.table("nfl_teams").select("*").execute().data
+    existing_teams = (
+        db.table("nfl_teams").select("team_id", count="exact", head=True).execute().count or 0
+    )
 
     if existing_teams:
         response = input("Data already exists. Reinitialize? (y/N): ")
@@ -219,33 +269,9 @@ def main() -> None:
             return
 
         print("Clearing existing data...")
-        tables = [
-            "pool_scores",
-            "team_selections",
-            "pool_participants",
-            "pools",
-            "profiles",
-            "users",
-            "team_performance",
-            "nfl_games",
-            "nfl_weeks",
-            "nfl_seasons",
-            "nfl_teams",
-        ]
-
-        for table in tables:
-            try:
-                # Delete all records from table
-                db.table(table).delete().neq("id", "impossible_value").execute()
-            except Exception as e:
-                print(f"Warning: Could not clear table {table}: {e}")
-                # Continue anyway
-
-    init_nfl_teams(db)
-    season_id = init_seasons_and_weeks(db)
-    init_team_performance(db, season_id)
-    init_sample_users(db)
-    init_sample_pool(db)
+        db.rpc("reset_family_huddle").execute()
+
+    init_all(db)
 
     print("\n✅ Initialization complete!")
     print("\nYou can now run the app with: streamlit run app.py")
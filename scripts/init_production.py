@@ -6,13 +6,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from scripts.init_data import (
-    init_nfl_teams,
-    init_seasons_and_weeks,
-    init_team_performance,
-    init_sample_users,
-    init_sample_pool,
-)
+from scripts.init_data import init_all
 from family_huddle.services.database import create_admin_client
 
 
@@ -25,20 +19,18 @@ def main() -> None:
         db = create_admin_client()
         
         # Check if already initialized
-        existing_teams = db.table("nfl_teams").select("*").execute().data
+        existing_teams = (
+            db.table("nfl_teams").select("team_id", count="exact", head=True).execute().count or 0
+        )
         
         if existing_teams:
             print("⚠️  Database already initialized. Skipping data initialization.")
-            print(f"Found {len(existing_teams)} teams in database.")
+            print(f"Found {existing_teams} teams in database.")
             return
         
         print("🚀 Initializing production database...")
         
-        init_nfl_teams(db)
-        season_id = init_seasons_and_weeks(db)
-        init_team_performance(db, season_id)
-        init_sample_users(db)
-        init_sample_pool(db)
+        init_all(db)
         
         print("\n✅ Production initialization complete!")
         print("\nTest credentials:")
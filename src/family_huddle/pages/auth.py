@@ -1,29 +1,56 @@
 """Authentication and profile management pages."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import bcrypt
 import streamlit as st
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from family_huddle.services.queries import load_profiles, load_user
 
 if TYPE_CHECKING:
     from supabase import Client
 
+# argon2id parameters for new password hashes (OWASP minimum: 19 MiB, 2 passes).
+# Hashes created with other parameters still verify, since they carry their own.
+_PASSWORD_HASHER = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
+@st.cache_resource
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Get the executor shared by all sessions for password hashing.
+
+    argon2 and bcrypt both release the GIL while hashing, so worker threads run
+    in parallel. Capping the pool at the CPU count keeps a burst of logins from
+    oversubscribing the cores; extra requests queue instead.
+
+    Returns:
+        ThreadPoolExecutor: Process-wide executor sized to the CPU count.
+    """
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt.
+    """Hash a password using argon2id.
 
     Args:
         password: The plain text password to hash.
 
     Returns:
-        str: The bcrypt hashed password as a string.
+        str: The encoded argon2id hash, including its salt and parameters.
     """
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    return _get_hash_pool().submit(_PASSWORD_HASHER.hash, password).result()
 
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash.
 
+    Accepts argon2id hashes as well as bcrypt hashes created before the switch
+    to argon2id.
+
     Args:
         password: The plain text password to verify.
         hashed: The hashed password to compare against.
@@ -31,7 +58,30 @@ def verify_password(password: str, hashed: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+    if hashed.startswith("$argon2"):
+        return _get_hash_pool().submit(_verify_argon2, password, hashed).result()
+
+    return (
+        _get_hash_pool()
+        .submit(bcrypt.checkpw, password.encode("utf-8"), hashed.encode("utf-8"))
+        .result()
+    )
+
+
+def _verify_argon2(password: str, hashed: str) -> bool:
+    """Verify a password against an argon2 hash.
+
+    Args:
+        password: The plain text password to verify.
+        hashed: The encoded argon2 hash to compare against.
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise.
+    """
+    try:
+        return _PASSWORD_HASHER.verify(hashed, password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def show_login(db: "Client") -> None:
@@ -55,7 +105,12 @@ def show_login(db: "Client") -> None:
 
         if submitted:
             if email and password:
-                result = db.table("users").select("*").eq("email", email).execute()
+                result = (
+                    db.table("users")
+                    .select("user_id", "email", "password_hash")
+                    .eq("email", email)
+                    .execute()
+                )
 
                 if result.data and verify_password(password, result.data[0]["password_hash"]):
                     user = result.data[0]
@@ -85,36 +140,23 @@ def show_login(db: "Client") -> None:
             elif len(new_password) < 6:
                 st.error("Password must be at least 6 characters long")
             else:
-                existing = db.table("users").select("*").eq("email", new_email).execute()
-
-                if existing.data:
-                    st.error("An account with this email already exists")
+                # signup_user inserts the user and default profile in one transaction
+                # and returns no rows if the email is already registered.
+                result = db.rpc(
+                    "signup_user",
+                    {
+                        "p_email": new_email,
+                        "p_password_hash": hash_password(new_password),
+                        "p_first_name": first_name,
+                        "p_last_name": last_name,
+                    },
+                ).execute()
+
+                if result.data:
+                    st.success("Account created successfully! Please log in.")
+                    st.info("A default profile has been created for you.")
                 else:
-                    hashed_pw = hash_password(new_password)
-
-                    user_data = {
-                        "email": new_email,
-                        "password_hash": hashed_pw,
-                        "first_name": first_name,
-                        "last_name": last_name,
-                        "is_active": True,
-                        "email_verified": False,
-                    }
-
-                    result = db.table("users").insert(user_data).execute()
-
-                    if result.data:
-                        profile_data = {
-                            "user_id": result.data[0]["user_id"],
-                            "profile_name": f"{first_name} {last_name}",
-                            "display_name": f"{first_name} {last_name}",
-                        }
-                        db.table("profiles").insert(profile_data).execute()
-
-                        st.success("Account created successfully! Please log in.")
-                        st.info("A default profile has been created for you.")
-                    else:
-                        st.error("Error creating account. Please try again.")
+                    st.error("An account with this email already exists")
 
 
 def show_profile(db: "Client") -> None:
@@ -130,7 +172,7 @@ def show_profile(db: "Client") -> None:
 
     user_id = st.session_state.user_id
 
-    user = db.table("users").select("*").eq("user_id", user_id).execute().data[0]
+    user = load_user(db, user_id)
 
     col1, col2 = st.columns(2)
 
@@ -150,11 +192,11 @@ def show_profile(db: "Client") -> None:
     st.subheader("My Profiles")
     st.info("You can create multiple profiles to participate in different pools.")
 
-    profiles = db.table("profiles").select("*").eq("user_id", user_id).execute()
+    profiles = load_profiles(db, user_id)
 
-    if profiles.data:
+    if profiles:
         profile_data = []
-        for profile in profiles.data:
+        for profile in profiles:
             profile_data.append(
                 {
                     "Profile Name": profile["profile_name"],
@@ -174,29 +216,28 @@ def show_profile(db: "Client") -> None:
 
         if submitted:
             if profile_name and display_name:
-                existing = (
+                new_profile_data = {
+                    "user_id": user_id,
+                    "profile_name": profile_name,
+                    "display_name": display_name,
+                }
+
+                # Duplicate names hit the unique constraint and come back empty
+                result = (
                     db.table("profiles")
-                    .select("*")
-                    .eq("user_id", user_id)
-                    .eq("profile_name", profile_name)
+                    .upsert(
+                        new_profile_data,
+                        on_conflict="user_id,profile_name",
+                        ignore_duplicates=True,
+                    )
                     .execute()
                 )
 
-                if existing.data:
-                    st.error("You already have a profile with this name")
+                if result.data:
+                    load_profiles.clear(db, user_id)
+                    st.success("Profile created successfully!")
+                    st.rerun()
                 else:
-                    new_profile_data = {
-                        "user_id": user_id,
-                        "profile_name": profile_name,
-                        "display_name": display_name,
-                    }
-
-                    result = db.table("profiles").insert(new_profile_data).execute()
-
-                    if result.data:
-                        st.success("Profile created successfully!")
-                        st.rerun()
-                    else:
-                        st.error("Error creating profile")
+                    st.error("You already have a profile with this name")
             else:
                 st.error("Please fill in all fields")
@@ -1,10 +1,13 @@
 """Home page for the Family Football Pool application."""
 
-from datetime import datetime
+import functools
+from datetime import date
 from typing import TYPE_CHECKING
 
 import streamlit as st
 
+from family_huddle.services.queries import load_user
+
 if TYPE_CHECKING:
     from supabase import Client
 
@@ -20,7 +23,7 @@ def show(db: "Client") -> None:
     """
     st.title("🏈 Family Football Pool - Home")
 
-    user = db.table("users").select("*").eq("user_id", st.session_state.user_id).execute().data[0]
+    user = load_user(db, st.session_state.user_id)
     st.markdown(f"### Welcome back, {user['first_name']}!")
 
     current_profile = st.session_state.current_profile
@@ -29,27 +32,27 @@ def show(db: "Client") -> None:
         st.warning("Please select or create a profile to get started!")
         st.stop()
 
+    participants = (
+        db.table("pool_participants")
+        .select("pool_id", "pool:pools(pool_name, season_year, is_active)")
+        .eq("profile_id", current_profile["profile_id"])
+        .execute()
+    )
+
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        participant_count = (
-            db.table("pool_participants")
-            .select("*")
-            .eq("profile_id", current_profile["profile_id"])
-            .execute()
-        )
-
-        st.metric("Active Pools", len(participant_count.data) if participant_count.data else 0)
+        st.metric("Active Pools", len(participants.data))
 
     with col2:
         selections = (
             db.table("team_selections")
-            .select("*")
+            .select("selection_id", count="exact", head=True)
             .eq("profile_id", current_profile["profile_id"])
             .execute()
         )
 
-        st.metric("Teams Selected", len(selections.data) if selections.data else 0)
+        st.metric("Teams Selected", selections.count or 0)
 
     with col3:
         current_week = _get_current_week()
@@ -77,36 +80,29 @@ def show(db: "Client") -> None:
     st.subheader("Recent Activity")
 
     pools_data = []
-    participants = (
-        db.table("pool_participants")
-        .select("*")
-        .eq("profile_id", current_profile["profile_id"])
-        .execute()
-    )
 
     if participants.data:
-        for participant in participants.data:
-            pool = db.table("pools").select("*").eq("pool_id", participant["pool_id"]).execute()
-
-            if pool.data:
-                pool_info = pool.data[0]
-                scores = (
-                    db.table("pool_scores")
-                    .select("*")
-                    .eq("pool_id", participant["pool_id"])
-                    .eq("profile_id", current_profile["profile_id"])
-                    .execute()
-                )
+        standings = (
+            db.table("pool_standings")
+            .select("pool_id", "total_points", "rank_position")
+            .eq("profile_id", current_profile["profile_id"])
+            .in_("pool_id", [participant["pool_id"] for participant in participants.data])
+            .execute()
+        )
+        standings_by_pool = {standing["pool_id"]: standing for standing in standings.data}
 
-                latest_score = scores.data[-1] if scores.data else None
+        for participant in participants.data:
+            pool_info = participant["pool"]
 
+            if pool_info:
+                standing = standings_by_pool.get(participant["pool_id"])
                 pools_data.append(
                     {
                         "Pool Name": pool_info["pool_name"],
                         "Season": pool_info["season_year"],
                         "Status": "Active" if pool_info["is_active"] else "Inactive",
-                        "Total Points": latest_score["total_points"] if latest_score else 0,
-                        "Rank": latest_score["rank_position"] if latest_score else "-",
+                        "Total Points": standing["total_points"] if standing else 0,
+                        "Rank": standing["rank_position"] if standing else "-",
                     }
                 )
 
@@ -126,9 +122,24 @@ def _get_current_week() -> int:
     Returns:
         int: Current NFL week number (0 if before season, 1-18 during season).
     """
-    season_start = datetime(datetime.now().year, 9, 7)
-    if datetime.now() < season_start:
+    return _week_for(date.today())
+
+
+@functools.lru_cache(maxsize=2)
+def _week_for(today: date) -> int:
+    """Calculate the NFL week for a given day.
+
+    Memoized per day so reruns skip the date arithmetic.
+
+    Args:
+        today: Day to calculate the NFL week for.
+
+    Returns:
+        int: NFL week number (0 if before season, 1-18 during season).
+    """
+    season_start = date(today.year, 9, 7)
+    if today < season_start:
         return 0
 
-    weeks_elapsed = (datetime.now() - season_start).days // 7
+    weeks_elapsed = (today - season_start).days // 7
     return min(max(1, weeks_elapsed + 1), 18)
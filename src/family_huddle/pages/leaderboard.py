@@ -2,13 +2,20 @@
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
+from family_huddle.services.queries import load_profile_pools, load_teams_by_id
+
 if TYPE_CHECKING:
     from supabase import Client
 
+# Source of the mock weekly and team stats until real results are tracked.
+_rng = np.random.default_rng()
+
 
 def show(db: "Client") -> None:
     """Display the leaderboard interface with pool selection.
@@ -27,23 +34,16 @@ def show(db: "Client") -> None:
         st.warning("Please select or create a profile first!")
         st.stop()
 
-    participants = (
-        db.table("pool_participants")
-        .select("*")
-        .eq("profile_id", current_profile["profile_id"])
-        .execute()
-    )
+    pools = load_profile_pools(db, current_profile["profile_id"])
 
-    if not participants.data:
+    if not pools:
         st.info("You haven't joined any pools yet!")
         return
 
     pool_options = []
     pool_map = {}
 
-    for participant in participants.data:
-        pool = db.table("pools").select("*").eq("pool_id", participant["pool_id"]).execute().data[0]
-
+    for pool in pools:
         pool_name = f"{pool['pool_name']} ({pool['season_year']})"
         pool_options.append(pool_name)
         pool_map[pool_name] = pool
@@ -64,11 +64,11 @@ def show(db: "Client") -> None:
     with col3:
         all_participants = (
             db.table("pool_participants")
-            .select("*")
+            .select("participant_id", count="exact", head=True)
             .eq("pool_id", selected_pool["pool_id"])
             .execute()
         )
-        st.metric("Participants", len(all_participants.data) if all_participants.data else 0)
+        st.metric("Participants", all_participants.count or 0)
 
     tab1, tab2, tab3 = st.tabs(["Overall Standings", "Weekly Performance", "Team Performance"])
 
@@ -94,110 +94,45 @@ def show_overall_standings(db: "Client", pool: dict[str, Any]) -> None:
     """
     st.subheader("Overall Standings")
 
-    participants = (
-        db.table("pool_participants").select("*").eq("pool_id", pool["pool_id"]).execute()
+    standings = (
+        db.table("pool_standings")
+        .select(
+            "rank_position", "display_name", "team_codes", "total_points", "selections_complete"
+        )
+        .eq("pool_id", pool["pool_id"])
+        .order("rank_position")
+        .execute()
     )
 
-    if not participants.data:
+    if not standings.data:
         st.info("No participants in this pool yet.")
         return
 
-    standings_data = []
-
-    for participant in participants.data:
-        profile = (
-            db.table("profiles")
-            .select("*")
-            .eq("profile_id", participant["profile_id"])
-            .execute()
-            .data[0]
-        )
-
-        scores = (
-            db.table("pool_scores")
-            .select("*")
-            .eq("pool_id", pool["pool_id"])
-            .eq("profile_id", participant["profile_id"])
-            .execute()
-        )
-
-        if not scores.data:
-            import random
-
-            weeks = db.table("nfl_weeks").select("*").limit(1).execute()
-            week_id = weeks.data[0]["week_id"] if weeks.data else None
-
-            mock_score = {
-                "pool_id": pool["pool_id"],
-                "profile_id": participant["profile_id"],
-                "week_id": week_id,
-                "points_earned": random.randint(20, 100),
-                "total_points": random.randint(100, 500),
-            }
-            db.table("pool_scores").insert(mock_score).execute()
-            total_points = mock_score["total_points"]
-        else:
-            total_points = scores.data[-1]["total_points"]
-
-        selections = (
-            db.table("team_selections")
-            .select("*")
-            .eq("pool_id", pool["pool_id"])
-            .eq("profile_id", participant["profile_id"])
-            .execute()
-        )
-
-        teams = []
-        if selections.data:
-            for selection in sorted(selections.data, key=lambda x: x["selection_order"]):
-                team = (
-                    db.table("nfl_teams")
-                    .select("*")
-                    .eq("team_id", selection["team_id"])
-                    .execute()
-                    .data[0]
-                )
-                teams.append(f"{team['team_code']}")
-
-        standings_data.append(
-            {
-                "Rank": 0,  # Will be calculated
-                "Name": profile["display_name"],
-                "Teams": ", ".join(teams) if teams else "No teams selected",
-                "Total Points": total_points,
-                "Status": "✅" if participant["selections_complete"] else "⚠️ Incomplete",
-            }
-        )
-
-    standings_data.sort(key=lambda x: x["Total Points"], reverse=True)
-    for i, standing in enumerate(standings_data):
-        standing["Rank"] = i + 1
-
-    df = pd.DataFrame(standings_data)
+    df = pd.DataFrame(standings.data)
+    df = pd.DataFrame(
+        {
+            "Rank": df["rank_position"],
+            "Name": df["display_name"],
+            "Teams": df["team_codes"].fillna("No teams selected"),
+            "Total Points": df["total_points"],
+            "Status": np.where(df["selections_complete"], "✅", "⚠️ Incomplete"),
+        }
+    )
 
     current_profile_name = st.session_state.current_profile["display_name"]
 
-    def highlight_user(row: Any) -> list[str]:
-        if row["Name"] == current_profile_name:
-            return ["background-color: #ffffcc"] * len(row)
-        return [""] * len(row)
-
-    styled_df = df.style.apply(highlight_user, axis=1)
+    highlight_rows = df.index[df["Name"] == current_profile_name]
+    styled_df = df.style.apply(
+        lambda row: ["background-color: #ffffcc"] * len(row),
+        axis=1,
+        subset=pd.IndexSlice[highlight_rows, :],
+    )
     st.dataframe(styled_df, use_container_width=True, hide_index=True)
 
-    if len(standings_data) > 1:
+    if len(df) > 1:
         st.subheader("Points Distribution")
 
-        fig = px.bar(
-            df,
-            x="Name",
-            y="Total Points",
-            title="Total Points by Participant",
-            color="Total Points",
-            color_continuous_scale="Blues",
-        )
-
-        fig.update_layout(showlegend=False)
+        fig = _points_chart(df[["Name", "Total Points"]])
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -214,42 +149,25 @@ def show_weekly_performance(db: "Client", pool: dict[str, Any]) -> None:
 
     st.info("Weekly performance tracking will be available once the season starts!")
 
-    weeks = list(range(1, 8))
-    mock_data = []
-
     participants = (
-        db.table("pool_participants").select("*").eq("pool_id", pool["pool_id"]).execute()
+        db.table("pool_participants")
+        .select("profile:profiles(display_name)")
+        .eq("pool_id", pool["pool_id"])
+        .limit(5)  # Show top 5
+        .execute()
     )
 
     if participants.data:
-        for participant in participants.data[:5]:  # Show top 5
-            profile = (
-                db.table("profiles")
-                .select("*")
-                .eq("profile_id", participant["profile_id"])
-                .execute()
-                .data[0]
-            )
-
-            import random
-
-            weekly_points = [random.randint(20, 80) for _ in weeks]
-            cumulative = []
-            total = 0
-            for points in weekly_points:
-                total += points
-                cumulative.append(total)
-
-            for week, points in zip(weeks, cumulative, strict=False):
-                mock_data.append(
-                    {
-                        "Week": f"Week {week}",
-                        "Participant": profile["display_name"],
-                        "Cumulative Points": points,
-                    }
-                )
-
-        df = pd.DataFrame(mock_data)
+        names = [participant["profile"]["display_name"] for participant in participants.data]
+        weeks = [f"Week {week}" for week in range(1, 8)]
+        cumulative = _rng.integers(20, 81, size=(len(names), len(weeks))).cumsum(axis=1)
+
+        df = (
+            pd.DataFrame(cumulative, index=names, columns=weeks)
+            .rename_axis("Participant")
+            .reset_index()
+            .melt("Participant", var_name="Week", value_name="Cumulative Points")
+        )
 
         fig = px.line(
             df,
@@ -276,69 +194,84 @@ def show_team_performance(db: "Client", pool: dict[str, Any]) -> None:
     st.subheader("Team Performance Analysis")
 
     all_selections = (
-        db.table("team_selections").select("*").eq("pool_id", pool["pool_id"]).execute()
+        db.table("team_selections").select("team_id").eq("pool_id", pool["pool_id"]).execute()
     )
 
     if not all_selections.data:
         st.info("No teams have been selected yet.")
         return
 
-    team_counts = {}
-    team_performance = {}
+    team_labels = {
+        team_id: f"{team['team_city']} {team['team_name']}"
+        for team_id, team in load_teams_by_id(db).items()
+    }
+    team_ids = pd.Series([selection["team_id"] for selection in all_selections.data])
+    team_counts = team_ids.map(team_labels).value_counts()
 
-    for selection in all_selections.data:
-        team_id = selection["team_id"]
-        team = db.table("nfl_teams").select("*").eq("team_id", team_id).execute().data[0]
+    st.markdown("#### Most Popular Teams")
 
-        team_name = f"{team['team_city']} {team['team_name']}"
+    popular_df = team_counts.head(10).rename_axis("Team").reset_index(name="Times Selected")
 
-        if team_name not in team_counts:
-            team_counts[team_name] = 0
-            import random
+    if not popular_df.empty:
+        fig = _popular_teams_chart(popular_df)
+        st.plotly_chart(fig, use_container_width=True)
 
-            team_performance[team_name] = {
-                "Wins": random.randint(0, 8),
-                "Losses": random.randint(0, 8),
-                "Points For": random.randint(150, 300),
-                "Points Against": random.randint(150, 300),
-            }
+    st.markdown("#### Team Performance")
 
-        team_counts[team_name] += 1
+    # Wins, losses, points for and points against for every team in one draw.
+    team_stats = _rng.integers((0, 0, 150, 150), (9, 9, 301, 301), size=(len(team_counts), 4))
+    wins, losses, points_for, points_against = team_stats.T
+    games = wins + losses
+    win_pct = np.divide(wins * 100, games, out=np.zeros(len(games)), where=games > 0)
+
+    perf_df = pd.DataFrame(
+        {
+            "Team": team_counts.index,
+            "W-L": [f"{won}-{lost}" for won, lost in zip(wins, losses, strict=True)],
+            "Win %": win_pct,
+            "PF": points_for,
+            "PA": points_against,
+            "Selected By": team_counts.to_numpy(),
+        }
+    ).sort_values("Win %", ascending=False, kind="stable")
+
+    st.dataframe(
+        perf_df.style.format({"Win %": "{:.1f}%"}), use_container_width=True, hide_index=True
+    )
 
-    st.markdown("#### Most Popular Teams")
 
-    popular_df = pd.DataFrame(
-        [
-            {"Team": team, "Times Selected": count}
-            for team, count in sorted(team_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
+@st.cache_data(ttl=300, show_spinner=False)
+def _points_chart(points_df: pd.DataFrame) -> go.Figure:
+    """Build the total points bar chart, reusing the figure while the data is unchanged.
+
+    Args:
+        points_df: Standings with ``Name`` and ``Total Points`` columns.
+
+    Returns:
+        go.Figure: Bar chart of total points by participant.
+    """
+    fig = px.bar(
+        points_df,
+        x="Name",
+        y="Total Points",
+        title="Total Points by Participant",
+        color="Total Points",
+        color_continuous_scale="Blues",
     )
+    fig.update_layout(showlegend=False)
+    return fig
 
-    if not popular_df.empty:
-        fig = px.bar(
-            popular_df, x="Times Selected", y="Team", orientation="h", title="Most Selected Teams"
-        )
-        st.plotly_chart(fig, use_container_width=True)
 
-    st.markdown("#### Team Performance")
+@st.cache_data(ttl=300, show_spinner=False)
+def _popular_teams_chart(popular_df: pd.DataFrame) -> go.Figure:
+    """Build the most selected teams bar chart, reusing the figure while the data is unchanged.
+
+    Args:
+        popular_df: Teams with ``Team`` and ``Times Selected`` columns.
 
-    perf_data = []
-    for team, stats in team_performance.items():
-        if team in team_counts:
-            perf_data.append(
-                {
-                    "Team": team,
-                    "W-L": f"{stats['Wins']}-{stats['Losses']}",
-                    "Win %": f"{(stats['Wins'] / (stats['Wins'] + stats['Losses']) * 100):.1f}%"
-                    if stats["Wins"] + stats["Losses"] > 0
-                    else "0.0%",
-                    "PF": stats["Points For"],
-                    "PA": stats["Points Against"],
-                    "Selected By": team_counts[team],
-                }
-            )
-
-    if perf_data:
-        perf_df = pd.DataFrame(perf_data)
-        perf_df = perf_df.sort_values("Win %", ascending=False)
-        st.dataframe(perf_df, use_container_width=True, hide_index=True)
+    Returns:
+        go.Figure: Horizontal bar chart of selection counts by team.
+    """
+    return px.bar(
+        popular_df, x="Times Selected", y="Team", orientation="h", title="Most Selected Teams"
+    )
@@ -1,10 +1,13 @@
 """Pool management page."""
 
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 import streamlit as st
 
+from family_huddle.services.queries import load_profile_pools, load_teams_by_id
+
 if TYPE_CHECKING:
     from supabase import Client
 
@@ -48,82 +51,79 @@ def show_my_pools(db: "Client", current_profile: dict[str, Any]) -> None:
     """
     st.subheader("Pools I'm Participating In")
 
+    # Joining or creating a pool clears this profile's cached entry, so a new
+    # membership shows up here on the next rerun rather than after the TTL
+    if not load_profile_pools(db, current_profile["profile_id"]):
+        st.info("You haven't joined any pools yet. Check the 'Join Pool' tab to get started!")
+        return
+
     participants = (
         db.table("pool_participants")
-        .select("*")
+        .select(
+            "pool_id",
+            "selections_complete",
+            "joined_at",
+            "created_at",
+            "pool:pools(pool_id, pool_name, pool_description, season_year, entry_fee, "
+            "max_participants, is_active)",
+        )
         .eq("profile_id", current_profile["profile_id"])
         .execute()
     )
 
-    if not participants.data:
-        st.info("You haven't joined any pools yet. Check the 'Join Pool' tab to get started!")
-        return
+    selections = (
+        db.table("team_selections")
+        .select("pool_id", "team_id", "selection_order")
+        .eq("profile_id", current_profile["profile_id"])
+        .in_("pool_id", [participant["pool_id"] for participant in participants.data])
+        .order("selection_order")
+        .execute()
+    )
+    selections_by_pool: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for selection in selections.data:
+        selections_by_pool[selection["pool_id"]].append(selection)
+
+    teams_by_id = load_teams_by_id(db)
 
+    pool_cards = []
     for participant in participants.data:
-        pool_result = db.table("pools").select("*").eq("pool_id", participant["pool_id"]).execute()
+        pool = participant["pool"]
 
-        if not pool_result.data:
+        if not pool:
             continue
 
-        pool = pool_result.data[0]
+        teams = []
+        for selection in selections_by_pool[pool["pool_id"]]:
+            team = teams_by_id.get(selection["team_id"])
 
-        with st.expander(f"🏈 {pool['pool_name']} ({pool['season_year']})"):
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.write(f"**Description:** {pool['pool_description'] or 'No description'}")
-                st.write(f"**Entry Fee:** ${pool['entry_fee']}")
-                st.write(f"**Max Participants:** {pool['max_participants']}")
-
-            with col2:
-                st.write(f"**Status:** {'✅ Active' if pool['is_active'] else '❌ Inactive'}")
-                joined_date = participant.get("joined_at", participant.get("created_at", ""))
-                st.write(f"**Joined:** {joined_date[:10] if joined_date else 'Unknown'}")
-                st.write(
-                    f"**Teams Selected:** {'✅ Yes' if participant['selections_complete'] else '❌ No'}"
+            if team:
+                team_points = team.get("points", 0)
+                teams.append(
+                    f"{selection['selection_order']}. {team['team_city']} {team['team_name']} ({team_points} pts)"
                 )
+            else:
+                teams.append(f"{selection['selection_order']}. Unknown Team")
+
+        joined_date = participant.get("joined_at", participant.get("created_at", ""))
+        pool_cards.append(
+            {
+                "pool_id": pool["pool_id"],
+                "title": f"🏈 {pool['pool_name']} ({pool['season_year']})",
+                "description": f"**Description:** {pool['pool_description'] or 'No description'}",
+                "entry_fee": f"**Entry Fee:** ${pool['entry_fee']}",
+                "max_participants": f"**Max Participants:** {pool['max_participants']}",
+                "status": f"**Status:** {'✅ Active' if pool['is_active'] else '❌ Inactive'}",
+                "joined": f"**Joined:** {joined_date[:10] if joined_date else 'Unknown'}",
+                "selected": (
+                    f"**Teams Selected:** {'✅ Yes' if participant['selections_complete'] else '❌ No'}"
+                ),
+                "selections_complete": participant["selections_complete"],
+                "teams": teams,
+            }
+        )
 
-            selections = (
-                db.table("team_selections")
-                .select("*")
-                .eq("pool_id", pool["pool_id"])
-                .eq("profile_id", current_profile["profile_id"])
-                .execute()
-            )
-
-            if selections.data:
-                st.write("**Your Teams:**")
-                teams = []
-                for selection in sorted(selections.data, key=lambda x: x["selection_order"]):
-                    team_result = (
-                        db.table("nfl_teams")
-                        .select("*")
-                        .eq("team_id", selection["team_id"])
-                        .execute()
-                    )
-
-                    if team_result.data:
-                        team = team_result.data[0]
-                        team_points = team.get("points", 0)
-                        teams.append(
-                            f"{selection['selection_order']}. {team['team_city']} {team['team_name']} ({team_points} pts)"
-                        )
-                    else:
-                        teams.append(f"{selection['selection_order']}. Unknown Team")
-
-                for team in teams:
-                    st.write(f"  {team}")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                if not participant["selections_complete"] and st.button(
-                    "Select Teams", key=f"select_{pool['pool_id']}"
-                ):
-                    st.info("Go to 'Team Selection' page to pick your teams")
-
-            with col2:
-                if st.button("View Leaderboard", key=f"leader_{pool['pool_id']}"):
-                    st.info("Go to 'Leaderboards' page to see rankings")
+    for card in pool_cards:
+        _render_pool_card(card)
 
 
 def show_join_pool(db: "Client", current_profile: dict[str, Any]) -> None:
@@ -138,67 +138,44 @@ def show_join_pool(db: "Client", current_profile: dict[str, Any]) -> None:
     """
     st.subheader("Available Pools")
 
-    pools = db.table("pools").select("*").eq("is_active", True).execute()
+    my_pool_ids = {p["pool_id"] for p in load_profile_pools(db, current_profile["profile_id"])}
+
+    query = (
+        db.table("pools")
+        .select(
+            "pool_id",
+            "pool_name",
+            "pool_description",
+            "season_year",
+            "entry_fee",
+            "max_participants",
+        )
+        .eq("is_active", True)
+    )
+    if my_pool_ids:
+        query = query.not_.in_("pool_id", my_pool_ids)
+    available_pools = query.execute().data
 
-    if not pools.data:
-        st.info("No active pools available at the moment.")
+    if not available_pools:
+        if my_pool_ids:
+            st.info("You've already joined all available pools!")
+        else:
+            st.info("No active pools available at the moment.")
         return
 
-    my_pools = (
+    participants = (
         db.table("pool_participants")
         .select("pool_id")
-        .eq("profile_id", current_profile["profile_id"])
+        .in_("pool_id", [pool["pool_id"] for pool in available_pools])
         .execute()
     )
-
-    my_pool_ids = [p["pool_id"] for p in my_pools.data] if my_pools.data else []
-
-    available_pools = [p for p in pools.data if p["pool_id"] not in my_pool_ids]
-
-    if not available_pools:
-        st.info("You've already joined all available pools!")
-        return
+    participant_counts = Counter(participant["pool_id"] for participant in participants.data)
 
     for pool in available_pools:
-        participants = (
-            db.table("pool_participants").select("*").eq("pool_id", pool["pool_id"]).execute()
+        _render_available_pool(
+            db, pool, participant_counts[pool["pool_id"]], current_profile["profile_id"]
         )
 
-        participant_count = len(participants.data) if participants.data else 0
-
-        with st.container():
-            col1, col2, col3 = st.columns([3, 1, 1])
-
-            with col1:
-                st.markdown(f"### {pool['pool_name']}")
-                st.write(pool["pool_description"] or "No description provided")
-                st.write(f"Season: {pool['season_year']} | Entry Fee: ${pool['entry_fee']}")
-
-            with col2:
-                st.metric("Participants", f"{participant_count}/{pool['max_participants']}")
-
-            with col3:
-                if participant_count < pool["max_participants"]:
-                    if st.button("Join Pool", key=f"join_{pool['pool_id']}"):
-                        participant_data = {
-                            "pool_id": pool["pool_id"],
-                            "profile_id": current_profile["profile_id"],
-                            "selections_complete": False,
-                            "joined_at": datetime.now().isoformat(),
-                        }
-
-                        result = db.table("pool_participants").insert(participant_data).execute()
-
-                        if result.data:
-                            st.success(f"Successfully joined {pool['pool_name']}!")
-                            st.rerun()
-                        else:
-                            st.error("Failed to join pool. Please try again.")
-                else:
-                    st.write("**FULL**")
-
-            st.divider()
-
 
 def show_create_pool(db: "Client") -> None:
     """Display the pool creation form.
@@ -211,6 +188,8 @@ def show_create_pool(db: "Client") -> None:
     """
     st.subheader("Create New Pool")
 
+    now = datetime.now()
+
     with st.form("create_pool_form"):
         pool_name = st.text_input("Pool Name", placeholder="Family Football 2024")
         pool_description = st.text_area("Description", placeholder="Annual family football pool")
@@ -220,9 +199,9 @@ def show_create_pool(db: "Client") -> None:
         with col1:
             season_year = st.number_input(
                 "Season Year",
-                min_value=datetime.now().year,
-                max_value=datetime.now().year + 1,
-                value=datetime.now().year,
+                min_value=now.year,
+                max_value=now.year + 1,
+                value=now.year,
             )
             entry_fee = st.number_input("Entry Fee ($)", min_value=0.0, value=0.0, step=5.0)
 
@@ -240,7 +219,7 @@ def show_create_pool(db: "Client") -> None:
             if not pool_name:
                 st.error("Please enter a pool name")
             else:
-                deadline = datetime.now() + timedelta(days=deadline_days)
+                deadline = now + timedelta(days=deadline_days)
 
                 pool_data = {
                     "pool_name": pool_name,
@@ -260,10 +239,11 @@ def show_create_pool(db: "Client") -> None:
                         "pool_id": result.data[0]["pool_id"],
                         "profile_id": st.session_state.current_profile["profile_id"],
                         "selections_complete": False,
-                        "joined_at": datetime.now().isoformat(),
+                        "joined_at": now.isoformat(),
                     }
 
                     db.table("pool_participants").insert(participant_data).execute()
+                    load_profile_pools.clear(db, participant_data["profile_id"])
 
                     st.success(
                         f"Pool '{pool_name}' created successfully! You've been automatically added as a participant."
@@ -271,3 +251,85 @@ def show_create_pool(db: "Client") -> None:
                     st.rerun()
                 else:
                     st.error("Failed to create pool. Please try again.")
+
+
+def _render_pool_card(card: dict[str, Any]) -> None:
+    """Render one of the profile's pools from its precomputed display strings.
+
+    Args:
+        card: Display strings and flags prepared by show_my_pools.
+    """
+    with st.expander(card["title"]):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write(card["description"])
+            st.write(card["entry_fee"])
+            st.write(card["max_participants"])
+
+        with col2:
+            st.write(card["status"])
+            st.write(card["joined"])
+            st.write(card["selected"])
+
+        if card["teams"]:
+            st.write("**Your Teams:**")
+            for team in card["teams"]:
+                st.write(f"  {team}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if not card["selections_complete"] and st.button(
+                "Select Teams", key=f"select_{card['pool_id']}"
+            ):
+                st.info("Go to 'Team Selection' page to pick your teams")
+
+        with col2:
+            if st.button("View Leaderboard", key=f"leader_{card['pool_id']}"):
+                st.info("Go to 'Leaderboards' page to see rankings")
+
+
+def _render_available_pool(
+    db: "Client", pool: dict[str, Any], participant_count: int, profile_id: str
+) -> None:
+    """Render a joinable pool with its participant count and join button.
+
+    Args:
+        db: Supabase client for database operations.
+        pool: Pool row to display.
+        participant_count: Number of profiles already in the pool.
+        profile_id: ID of the profile that would join the pool.
+    """
+    with st.container():
+        col1, col2, col3 = st.columns([3, 1, 1])
+
+        with col1:
+            st.markdown(f"### {pool['pool_name']}")
+            st.write(pool["pool_description"] or "No description provided")
+            st.write(f"Season: {pool['season_year']} | Entry Fee: ${pool['entry_fee']}")
+
+        with col2:
+            st.metric("Participants", f"{participant_count}/{pool['max_participants']}")
+
+        with col3:
+            if participant_count < pool["max_participants"]:
+                if st.button("Join Pool", key=f"join_{pool['pool_id']}"):
+                    participant_data = {
+                        "pool_id": pool["pool_id"],
+                        "profile_id": profile_id,
+                        "selections_complete": False,
+                        "joined_at": datetime.now().isoformat(),
+                    }
+
+                    result = db.table("pool_participants").insert(participant_data).execute()
+
+                    if result.data:
+                        load_profile_pools.clear(db, profile_id)
+                        st.success(f"Successfully joined {pool['pool_name']}!")
+                        st.rerun()
+                    else:
+                        st.error("Failed to join pool. Please try again.")
+            else:
+                st.write("**FULL**")
+
+        st.divider()
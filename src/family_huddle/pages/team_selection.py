@@ -4,11 +4,15 @@ from typing import TYPE_CHECKING, Any
 
 import streamlit as st
 
-from family_huddle.services.nfl_data import nfl_data
+from family_huddle.services.nfl_data import seed_nfl_teams
+from family_huddle.services.queries import load_profile_pools, load_teams_by_id
 
 if TYPE_CHECKING:
     from supabase import Client
 
+CONFERENCES = ("AFC", "NFC")
+DIVISIONS = ("East", "North", "South", "West")
+
 
 def show(db: "Client") -> None:
     """Display the team selection interface for pools.
@@ -27,23 +31,16 @@ def show(db: "Client") -> None:
         st.warning("Please select or create a profile first!")
         st.stop()
 
-    participants = (
-        db.table("pool_participants")
-        .select("*")
-        .eq("profile_id", current_profile["profile_id"])
-        .execute()
-    )
+    pools = load_profile_pools(db, current_profile["profile_id"])
 
-    if not participants.data:
+    if not pools:
         st.info("You haven't joined any pools yet. Check the 'My Pools' tab to join a pool!")
         return
 
     pool_options = []
     pool_map = {}
 
-    for participant in participants.data:
-        pool = db.table("pools").select("*").eq("pool_id", participant["pool_id"]).execute().data[0]
-
+    for pool in pools:
         pool_name = f"{pool['pool_name']} ({pool['season_year']})"
         pool_options.append(pool_name)
         pool_map[pool_name] = pool
@@ -55,11 +52,15 @@ def show(db: "Client") -> None:
 
     st.subheader(f"Team Selection for: {selected_pool['pool_name']}")
 
-    current_participant = next(
-        (p for p in participants.data if p["pool_id"] == selected_pool["pool_id"]), None
+    current_participant = (
+        db.table("pool_participants")
+        .select("selections_complete")
+        .eq("pool_id", selected_pool["pool_id"])
+        .eq("profile_id", current_profile["profile_id"])
+        .execute()
     )
-    selections_complete = current_participant and current_participant.get(
-        "selections_complete", False
+    selections_complete = bool(
+        current_participant.data and current_participant.data[0]["selections_complete"]
     )
 
     if selections_complete:
@@ -71,9 +72,10 @@ def show(db: "Client") -> None:
 
     current_selections = (
         db.table("team_selections")
-        .select("*")
+        .select("team_id")
         .eq("pool_id", selected_pool["pool_id"])
         .eq("profile_id", current_profile["profile_id"])
+        .order("selection_order")
         .execute()
     )
 
@@ -81,26 +83,19 @@ def show(db: "Client") -> None:
         [s["team_id"] for s in current_selections.data] if current_selections.data else []
     )
 
-    teams_df = nfl_data.import_teams()
+    teams_by_id = load_teams_by_id(db)
 
-    existing_teams = db.table("nfl_teams").select("*").execute()
+    if not teams_by_id:
+        inserted = seed_nfl_teams(db)
 
-    if not existing_teams.data:
-        for _, team in teams_df.iterrows():
-            team_data = {
-                "team_code": team["team_code"],
-                "team_name": team["team_name"],
-                "team_city": team["team_city"],
-                "conference": team["conference"],
-                "division": team["division"],
-                "points": team.get("points", 5),
-                "is_active": True,
-            }
-            db.table("nfl_teams").insert(team_data).execute()
+        # Drop the cached empty result; the inserted rows serve this run
+        load_teams_by_id.clear()
+        teams_by_id = {team["team_id"]: team for team in inserted}
 
-    all_teams = db.table("nfl_teams").select("*").execute().data
+    all_teams = teams_by_id.values()
+    team_ids_by_label = {_team_label(team): team["team_id"] for team in all_teams}
 
-    conferences: dict[str, dict[str, list[dict[str, Any]]]] = {"AFC": {}, "NFC": {}}
+    conferences: dict[str, dict[str, list[dict[str, Any]]]] = {conf: {} for conf in CONFERENCES}
 
     for team in all_teams:
         conf = team["conference"]
@@ -114,11 +109,9 @@ def show(db: "Client") -> None:
     st.markdown(f"### Current Selections ({len(selected_team_ids)}/4)")
 
     if selected_team_ids:
-        selected_teams = []
-        for team_id in selected_team_ids:
-            team = next((t for t in all_teams if t.get("team_id") == team_id), None)
-            if team:
-                selected_teams.append(team)
+        selected_teams = [
+            teams_by_id[team_id] for team_id in selected_team_ids if team_id in teams_by_id
+        ]
 
         if selected_teams:
             total_points = sum(team.get("points", 0) for team in selected_teams)
@@ -170,20 +163,13 @@ def show(db: "Client") -> None:
         save_button_text = "Update Selections" if selections_complete else "Save Selections"
         if st.button(save_button_text, type="primary", use_container_width=True):
             all_selected = []
+            session_state = st.session_state
 
-            name_to_id = {}
-            for team in all_teams:
-                team_points = team.get("points", 0)
-                team_name = f"{team['team_city']} {team['team_name']} ({team_points} pts)"
-                name_to_id[team_name] = team["team_id"]
-
-            for conf in ["AFC", "NFC"]:
-                for div in ["East", "North", "South", "West"]:
-                    key = f"team_{conf}_{div}"
-                    if key in st.session_state and st.session_state[key]:
-                        for team_name in st.session_state[key]:
-                            if team_name in name_to_id:
-                                all_selected.append(name_to_id[team_name])
+            for conf in CONFERENCES:
+                for div in DIVISIONS:
+                    for team_name in session_state.get(f"team_{conf}_{div}") or []:
+                        if team_name in team_ids_by_label:
+                            all_selected.append(team_ids_by_label[team_name])
 
             if len(all_selected) != 4:
                 st.error(f"Please select exactly 4 teams. You've selected {len(all_selected)}.")
@@ -192,14 +178,16 @@ def show(db: "Client") -> None:
                     "profile_id", current_profile["profile_id"]
                 ).execute()
 
-                for i, team_id in enumerate(all_selected):
-                    selection_data = {
+                selections_data = [
+                    {
                         "pool_id": selected_pool["pool_id"],
                         "profile_id": current_profile["profile_id"],
                         "team_id": team_id,
                         "selection_order": i + 1,
                     }
-                    db.table("team_selections").insert(selection_data).execute()
+                    for i, team_id in enumerate(all_selected)
+                ]
+                db.table("team_selections").insert(selections_data).execute()
 
                 db.table("pool_participants").update({"selections_complete": True}).eq(
                     "pool_id", selected_pool["pool_id"]
@@ -242,8 +230,7 @@ def show_conference_teams(
         team_map = {}
 
         for team in sorted(teams, key=lambda x: x["team_city"]):
-            team_points = team.get("points", 0)
-            team_name = f"{team['team_city']} {team['team_name']} ({team_points} pts)"
+            team_name = _team_label(team)
             team_options.append(team_name)
             team_map[team_name] = team["team_id"]
 
@@ -263,3 +250,15 @@ def show_conference_teams(
         for team_name in selected:
             if team_map[team_name] not in selected_teams:
                 selected_teams.append(team_map[team_name])
+
+
+def _team_label(team: dict[str, Any]) -> str:
+    """Format a team as it appears in the selection widgets.
+
+    Args:
+        team: NFL team row.
+
+    Returns:
+        str: Team city, name, and point value.
+    """
+    return f"{team['team_city']} {team['team_name']} ({team.get('points', 0)} pts)"
@@ -1,12 +1,18 @@
 """Database service using Supabase client."""
 
+import functools
 import os
-from typing import TYPE_CHECKING
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+import httpx
 
 if TYPE_CHECKING:
     from supabase import Client
 
 try:
+    from supabase import ClientOptions
     from supabase import create_client as create_supabase_client
 except ImportError as e:
     raise ImportError("Supabase client not available. Install with: pip install supabase") from e
@@ -42,6 +48,105 @@ def _get_config_value(key: str, streamlit_path: str | None = None) -> str | None
     return os.getenv(key)
 
 
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTP transport that retries rate-limited and transient server errors.
+
+    429 responses are retried for every method, since the request was never
+    processed. 502/503/504 are retried only for idempotent methods, so a
+    write is never applied twice. Waits back off exponentially with jitter
+    unless the server sends a Retry-After header.
+    """
+
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self, *, retries: int = 3, backoff: float = 0.25, max_delay: float = 5.0, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._retries = retries
+        self._backoff = backoff
+        self._max_delay = max_delay
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            httpx.Response: The first non-retryable response, or the last attempt's.
+        """
+        for attempt in range(self._retries):
+            response = super().handle_request(request)
+            if not self._should_retry(request, response):
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+
+        return super().handle_request(request)
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Decide whether a response is worth retrying.
+
+        Args:
+            request: The request that was sent.
+            response: The response it received.
+
+        Returns:
+            bool: True if the request can safely be sent again.
+        """
+        if response.status_code == 429:
+            return True
+        return (
+            response.status_code in self.RETRY_STATUSES
+            and request.method in self.IDEMPOTENT_METHODS
+        )
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Calculate how long to wait before the next attempt.
+
+        Args:
+            response: The response being retried.
+            attempt: Zero-based number of the attempt that just failed.
+
+        Returns:
+            float: Seconds to wait, capped at the transport's maximum delay.
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), self._max_delay)
+
+        delay = self._backoff * 2**attempt
+        return min(delay + random.uniform(0, delay), self._max_delay)
+
+
+def _create_http_client() -> httpx.Client:
+    """Create the pooled HTTP client that backs a Supabase client.
+
+    Idle connections are kept alive for several minutes and HTTP/2 is enabled,
+    so successive PostgREST requests reuse one TLS connection instead of
+    paying for a new handshake. The pool is capped so a burst of sessions
+    queues for a connection rather than opening an unbounded number, and
+    an unreachable host fails fast instead of waiting out the read timeout.
+    Rate limits and transient gateway errors are retried with backoff.
+
+    Returns:
+        httpx.Client: HTTP client with keep-alive connection pooling.
+    """
+    transport = _RetryTransport(
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=300),
+        http2=True,
+    )
+    return httpx.Client(
+        transport=transport,
+        timeout=httpx.Timeout(120, connect=5),
+        follow_redirects=True,
+    )
+
+
 def create_client() -> "Client":
     """Create a Supabase client using Streamlit secrets or environment variables.
 
@@ -61,7 +166,9 @@ def create_client() -> "Client":
             "or configure supabase.url and supabase.anon_key in Streamlit secrets."
         )
 
-    return create_supabase_client(supabase_url, supabase_key)
+    return create_supabase_client(
+        supabase_url, supabase_key, options=ClientOptions(httpx_client=_create_http_client())
+    )
 
 
 def create_admin_client() -> "Client":
@@ -82,4 +189,24 @@ def create_admin_client() -> "Client":
             "Set SUPABASE_URL and SUPABASE_SERVICE_KEY in environment variables "
             "or configure supabase.url and supabase.service_key in Streamlit secrets."
         )
-    return create_supabase_client(supabase_url, supabase_key)
+    return create_supabase_client(
+        supabase_url, supabase_key, options=ClientOptions(httpx_client=_create_http_client())
+    )
+
+
+def get_client() -> "Client":
+    """Get the Supabase client shared by the whole process.
+
+    Under Streamlit the client is a cached resource, so every session and
+    rerun reuses one client and its pooled connections.
+
+    Returns:
+        Client: Shared Supabase client configured from secrets or environment.
+
+    Raises:
+        ValueError: If required configuration is missing.
+    """
+    return create_client()
+
+
+get_client = st.cache_resource(get_client) if _STREAMLIT_AVAILABLE else functools.cache(get_client)
@@ -1,376 +1,240 @@
 """Mock NFL data provider for local testing."""
 
-import random
-from datetime import datetime, timedelta
-from typing import Any
+import functools
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    from supabase import Client
+
+_CONFERENCES = pd.CategoricalDtype(["AFC", "NFC"])
+_DIVISIONS = pd.CategoricalDtype(["East", "North", "South", "West"])
+_GAME_STATUSES = pd.CategoricalDtype(["SCHEDULED", "COMPLETED"])
+
+# nfl_teams columns populated from the provider's teams
+_TEAM_COLUMNS = ["team_code", "team_name", "team_city", "conference", "division", "points"]
+
+
+class Team(NamedTuple):
+    """A single NFL team record."""
+
+    team_code: str
+    team_name: str
+    team_city: str
+    conference: str
+    division: str
+    points: int
+
+
+# Static NFL team data shared by every provider instance
+_TEAMS: tuple[Team, ...] = (
+    # AFC East
+    Team("BUF", "Bills", "Buffalo", "AFC", "East", 10),
+    Team("MIA", "Dolphins", "Miami", "AFC", "East", 8),
+    Team("NE", "Patriots", "New England", "AFC", "East", 6),
+    Team("NYJ", "Jets", "New York", "AFC", "East", 4),
+    # AFC North
+    Team("BAL", "Ravens", "Baltimore", "AFC", "North", 9),
+    Team("CIN", "Bengals", "Cincinnati", "AFC", "North", 7),
+    Team("CLE", "Browns", "Cleveland", "AFC", "North", 5),
+    Team("PIT", "Steelers", "Pittsburgh", "AFC", "North", 10),
+    # AFC South
+    Team("HOU", "Texans", "Houston", "AFC", "South", 7),
+    Team("IND", "Colts", "Indianapolis", "AFC", "South", 6),
+    Team("JAX", "Jaguars", "Jacksonville", "AFC", "South", 5),
+    Team("TEN", "Titans", "Tennessee", "AFC", "South", 4),
+    # AFC West
+    Team("DEN", "Broncos", "Denver", "AFC", "West", 6),
+    Team("KC", "Chiefs", "Kansas City", "AFC", "West", 10),
+    Team("LV", "Raiders", "Las Vegas", "AFC", "West", 5),
+    Team("LAC", "Chargers", "Los Angeles", "AFC", "West", 8),
+    # NFC East
+    Team("DAL", "Cowboys", "Dallas", "NFC", "East", 9),
+    Team("NYG", "Giants", "New York", "NFC", "East", 5),
+    Team("PHI", "Eagles", "Philadelphia", "NFC", "East", 10),
+    Team("WAS", "Commanders", "Washington", "NFC", "East", 6),
+    # NFC North
+    Team("CHI", "Bears", "Chicago", "NFC", "North", 4),
+    Team("DET", "Lions", "Detroit", "NFC", "North", 9),
+    Team("GB", "Packers", "Green Bay", "NFC", "North", 8),
+    Team("MIN", "Vikings", "Minnesota", "NFC", "North", 7),
+    # NFC South
+    Team("ATL", "Falcons", "Atlanta", "NFC", "South", 6),
+    Team("CAR", "Panthers", "Carolina", "NFC", "South", 3),
+    Team("NO", "Saints", "New Orleans", "NFC", "South", 7),
+    Team("TB", "Buccaneers", "Tampa Bay", "NFC", "South", 8),
+    # NFC West
+    Team("ARI", "Cardinals", "Arizona", "NFC", "West", 5),
+    Team("LAR", "Rams", "Los Angeles", "NFC", "West", 7),
+    Team("SF", "49ers", "San Francisco", "NFC", "West", 10),
+    Team("SEA", "Seahawks", "Seattle", "NFC", "West", 6),
+)
+
 
 class MockNFLData:
     """Mock NFL data provider that simulates nfl_data_py functionality."""
 
     def __init__(self) -> None:
-        self.teams = self._create_teams()
+        self.teams = _TEAMS
         self.current_season = datetime.now().year
-
-    def _create_teams(self) -> list[dict[str, Any]]:
-        """Create mock NFL teams data."""
-        teams = [
-            # AFC East
-            {
-                "team_code": "BUF",
-                "team_name": "Bills",
-                "team_city": "Buffalo",
-                "conference": "AFC",
-                "division": "East",
-                "points": 10,
-            },
-            {
-                "team_code": "MIA",
-                "team_name": "Dolphins",
-                "team_city": "Miami",
-                "conference": "AFC",
-                "division": "East",
-                "points": 8,
-            },
-            {
-                "team_code": "NE",
-                "team_name": "Patriots",
-                "team_city": "New England",
-                "conference": "AFC",
-                "division": "East",
-                "points": 6,
-            },
-            {
-                "team_code": "NYJ",
-                "team_name": "Jets",
-                "team_city": "New York",
-                "conference": "AFC",
-                "division": "East",
-                "points": 4,
-            },
-            # AFC North
-            {
-                "team_code": "BAL",
-                "team_name": "Ravens",
-                "team_city": "Baltimore",
-                "conference": "AFC",
-                "division": "North",
-                "points": 9,
-            },
-            {
-                "team_code": "CIN",
-                "team_name": "Bengals",
-                "team_city": "Cincinnati",
-                "conference": "AFC",
-                "division": "North",
-                "points": 7,
-            },
-            {
-                "team_code": "CLE",
-                "team_name": "Browns",
-                "team_city": "Cleveland",
-                "conference": "AFC",
-                "division": "North",
-                "points": 5,
-            },
-            {
-                "team_code": "PIT",
-                "team_name": "Steelers",
-                "team_city": "Pittsburgh",
-                "conference": "AFC",
-                "division": "North",
-                "points": 10,
-            },
-            # AFC South
-            {
-                "team_code": "HOU",
-                "team_name": "Texans",
-                "team_city": "Houston",
-                "conference": "AFC",
-                "division": "South",
-                "points": 7,
-            },
-            {
-                "team_code": "IND",
-                "team_name": "Colts",
-                "team_city": "Indianapolis",
-                "conference": "AFC",
-                "division": "South",
-                "points": 6,
-            },
-            {
-                "team_code": "JAX",
-                "team_name": "Jaguars",
-                "team_city": "Jacksonville",
-                "conference": "AFC",
-                "division": "South",
-                "points": 5,
-            },
-            {
-                "team_code": "TEN",
-                "team_name": "Titans",
-                "team_city": "Tennessee",
-                "conference": "AFC",
-                "division": "South",
-                "points": 4,
-            },
-            # AFC West
-            {
-                "team_code": "DEN",
-                "team_name": "Broncos",
-                "team_city": "Denver",
-                "conference": "AFC",
-                "division": "West",
-                "points": 6,
-            },
-            {
-                "team_code": "KC",
-                "team_name": "Chiefs",
-                "team_city": "Kansas City",
-                "conference": "AFC",
-                "division": "West",
-                "points": 10,
-            },
-            {
-                "team_code": "LV",
-                "team_name": "Raiders",
-                "team_city": "Las Vegas",
-                "conference": "AFC",
-                "division": "West",
-                "points": 5,
-            },
-            {
-                "team_code": "LAC",
-                "team_name": "Chargers",
-                "team_city": "Los Angeles",
-                "conference": "AFC",
-                "division": "West",
-                "points": 8,
-            },
-            # NFC East
-            {
-                "team_code": "DAL",
-                "team_name": "Cowboys",
-                "team_city": "Dallas",
-                "conference": "NFC",
-                "division": "East",
-                "points": 9,
-            },
-            {
-                "team_code": "NYG",
-                "team_name": "Giants",
-                "team_city": "New York",
-                "conference": "NFC",
-                "division": "East",
-                "points": 5,
-            },
-            {
-                "team_code": "PHI",
-                "team_name": "Eagles",
-                "team_city": "Philadelphia",
-                "conference": "NFC",
-                "division": "East",
-                "points": 10,
-            },
-            {
-                "team_code": "WAS",
-                "team_name": "Commanders",
-                "team_city": "Washington",
-                "conference": "NFC",
-                "division": "East",
-                "points": 6,
-            },
-            # NFC North
-            {
-                "team_code": "CHI",
-                "team_name": "Bears",
-                "team_city": "Chicago",
-                "conference": "NFC",
-                "division": "North",
-                "points": 4,
-            },
-            {
-                "team_code": "DET",
-                "team_name": "Lions",
-                "team_city": "Detroit",
-                "conference": "NFC",
-                "division": "North",
-                "points": 9,
-            },
-            {
-                "team_code": "GB",
-                "team_name": "Packers",
-                "team_city": "Green Bay",
-                "conference": "NFC",
-                "division": "North",
-                "points": 8,
-            },
-            {
-                "team_code": "MIN",
-                "team_name": "Vikings",
-                "team_city": "Minnesota",
-                "conference": "NFC",
-                "division": "North",
-                "points": 7,
-            },
-            # NFC South
-            {
-                "team_code": "ATL",
-                "team_name": "Falcons",
-                "team_city": "Atlanta",
-                "conference": "NFC",
-                "division": "South",
-                "points": 6,
-            },
-            {
-                "team_code": "CAR",
-                "team_name": "Panthers",
-                "team_city": "Carolina",
-                "conference": "NFC",
-                "division": "South",
-                "points": 3,
-            },
-            {
-                "team_code": "NO",
-                "team_name": "Saints",
-                "team_city": "New Orleans",
-                "conference": "NFC",
-                "division": "South",
-                "points": 7,
-            },
-            {
-                "team_code": "TB",
-                "team_name": "Buccaneers",
-                "team_city": "Tampa Bay",
-                "conference": "NFC",
-                "division": "South",
-                "points": 8,
-            },
-            # NFC West
-            {
-                "team_code": "ARI",
-                "team_name": "Cardinals",
-                "team_city": "Arizona",
-                "conference": "NFC",
-                "division": "West",
-                "points": 5,
-            },
-            {
-                "team_code": "LAR",
-                "team_name": "Rams",
-                "team_city": "Los Angeles",
-                "conference": "NFC",
-                "division": "West",
-                "points": 7,
-            },
-            {
-                "team_code": "SF",
-                "team_name": "49ers",
-                "team_city": "San Francisco",
-                "conference": "NFC",
-                "division": "West",
-                "points": 10,
-            },
-            {
-                "team_code": "SEA",
-                "team_name": "Seahawks",
-                "team_city": "Seattle",
-                "conference": "NFC",
-                "division": "West",
-                "points": 6,
-            },
-        ]
-        return teams
+        self._team_codes = np.array([team.team_code for team in self.teams], dtype=object)
+        self._team_dtype = pd.CategoricalDtype(self._team_codes)
+        self._teams_df = pd.DataFrame.from_records(self.teams, columns=Team._fields).astype(
+            {
+                "team_code": self._team_dtype,
+                "conference": _CONFERENCES,
+                "division": _DIVISIONS,
+                "points": np.int8,
+            }
+        )
+        self._rng = np.random.default_rng()
+        # Per-instance caches so repeated imports reuse the generated frames
+        self._schedules = functools.lru_cache(maxsize=32)(self._build_schedules)
+        self._team_stats = functools.lru_cache(maxsize=32)(self._build_team_stats)
 
     def import_teams(self) -> pd.DataFrame:
-        """Import NFL teams data."""
-        return pd.DataFrame(self.teams)
+        """Import NFL teams data.
+
+        The DataFrame is built once in ``__init__`` and shared by every call,
+        so callers should treat it as read-only.
+        """
+        return self._teams_df
 
     def import_schedules(self, years: list[int]) -> pd.DataFrame:
-        """Import NFL schedules for given years."""
-        schedules = []
-
-        for year in years:
-            season_start = datetime(year, 9, 7)
-
-            for week in range(1, 19):  # 18 weeks
-                week_start = season_start + timedelta(weeks=week - 1)
-
-                teams_copy = self.teams.copy()
-                random.shuffle(teams_copy)
-
-                for i in range(0, len(teams_copy), 2):
-                    if i + 1 < len(teams_copy):
-                        home_team = teams_copy[i]["team_code"]
-                        away_team = teams_copy[i + 1]["team_code"]
-
-                        game_date = week_start + timedelta(
-                            days=random.choice([0, 3, 4])
-                        )  # Thu, Sun, Mon
-
-                        # Simulate some completed games
-                        if week < self._get_current_week(year):
-                            home_score = random.randint(0, 45)
-                            away_score = random.randint(0, 45)
-                            status = "COMPLETED"
-                        else:
-                            home_score = None
-                            away_score = None
-                            status = "SCHEDULED"
-
-                        schedules.append(
-                            {
-                                "season": year,
-                                "week": week,
-                                "game_date": game_date,
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "home_score": home_score,
-                                "away_score": away_score,
-                                "game_status": status,
-                            }
-                        )
-
-        return pd.DataFrame(schedules)
+        """Import NFL schedules for given years.
+
+        Results are cached per ``years`` and day, so callers should treat the
+        returned DataFrame as read-only.
+        """
+        return self._schedules(tuple(years), date.today())
 
     def import_team_stats(self, years: list[int]) -> pd.DataFrame:
-        """Import team statistics for given years."""
-        stats = []
-
-        for year in years:
-            for team in self.teams:
-                wins = random.randint(3, 14)
-                losses = 17 - wins
-
-                stats.append(
-                    {
-                        "season": year,
-                        "team": team["team_code"],
-                        "games_played": 17,
-                        "wins": wins,
-                        "losses": losses,
-                        "ties": 0,
-                        "win_percentage": wins / 17,
-                        "playoff_made": wins >= 10,  # Simplified playoff logic
-                    }
-                )
-
-        return pd.DataFrame(stats)
-
-    def _get_current_week(self, year: int) -> int:
-        """Get the current week of the NFL season."""
-        if year < datetime.now().year:
-            return 19  # Past season, all games complete
-        elif year > datetime.now().year:
-            return 0  # Future season
-        else:
-            # Current season - calculate week
-            season_start = datetime(year, 9, 7)
-            weeks_elapsed = (datetime.now() - season_start).days // 7
-            return min(max(1, weeks_elapsed + 1), 18)
-
-
-# Global instance for easy import
-nfl_data = MockNFLData()
+        """Import team statistics for given years.
+
+        Results are cached per ``years``, so callers should treat the returned
+        DataFrame as read-only.
+        """
+        return self._team_stats(tuple(years))
+
+    def _build_schedules(self, years: tuple[int, ...], today: date) -> pd.DataFrame:
+        """Generate mock schedules for the given years as of ``today``."""
+        n_years, n_teams = len(years), len(self.teams)
+        games_per_week = n_teams // 2
+        shape = (n_years, 18, games_per_week)  # 18 weeks
+
+        # Shuffle every week's team indices at once, then pair them off home/away.
+        # The indices double as category codes, so no team strings are built.
+        matchups = self._rng.permuted(
+            np.broadcast_to(np.arange(n_teams, dtype=np.int8), (n_years, 18, n_teams)), axis=-1
+        )
+        home_teams = matchups[..., 0 : games_per_week * 2 : 2]
+        away_teams = matchups[..., 1 : games_per_week * 2 : 2]
+
+        season_starts = np.array([f"{year}-09-07" for year in years], dtype="datetime64[s]")
+        week_starts = season_starts[:, None] + np.arange(18) * np.timedelta64(7, "D")
+        day_offsets = self._rng.choice([0, 3, 4], size=shape)  # Thu, Sun, Mon
+        game_dates = week_starts[..., None] + day_offsets.astype("timedelta64[D]")
+
+        # Simulate some completed games
+        current_weeks = np.array([_current_week(year, today) for year in years])
+        weeks = np.arange(1, 19, dtype=np.int8)
+        completed = np.broadcast_to(
+            weeks[None, :, None] < current_weeks[:, None, None], shape
+        ).ravel()
+        # Scores of scheduled games are masked out of the nullable Int16 columns
+        scores = self._rng.integers(0, 46, size=(completed.size, 2), dtype=np.int16)
+
+        return pd.DataFrame(
+            {
+                "season": np.repeat(np.array(years, dtype=np.int16), 18 * games_per_week),
+                "week": np.tile(np.repeat(weeks, games_per_week), n_years),
+                "game_date": game_dates.ravel(),
+                "home_team": pd.Categorical.from_codes(home_teams.ravel(), dtype=self._team_dtype),
+                "away_team": pd.Categorical.from_codes(away_teams.ravel(), dtype=self._team_dtype),
+                "home_score": pd.arrays.IntegerArray(scores[:, 0], ~completed),
+                "away_score": pd.arrays.IntegerArray(scores[:, 1], ~completed),
+                "game_status": pd.Categorical.from_codes(
+                    completed.astype(np.int8), dtype=_GAME_STATUSES
+                ),
+            }
+        )
+
+    def _build_team_stats(self, years: tuple[int, ...]) -> pd.DataFrame:
+        """Generate mock team statistics for the given years."""
+        n_years, n_teams = len(years), len(self.teams)
+
+        wins = self._rng.integers(3, 15, size=n_years * n_teams)
+
+        return pd.DataFrame(
+            {
+                "season": np.repeat(years, n_teams),
+                "team": pd.Categorical.from_codes(
+                    np.tile(np.arange(n_teams), n_years), dtype=self._team_dtype
+                ),
+                "games_played": 17,
+                "wins": wins,
+                "losses": 17 - wins,
+                "ties": 0,
+                "win_percentage": wins / 17,
+                "playoff_made": wins >= 10,  # Simplified playoff logic
+            }
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _current_week(year: int, today: date) -> int:
+    """Get the week of a season as of a given day, memoized per day."""
+    if year < today.year:
+        return 19  # Past season, all games complete
+    elif year > today.year:
+        return 0  # Future season
+    else:
+        # Current season - calculate week
+        season_start = date(year, 9, 7)
+        weeks_elapsed = (today - season_start).days // 7
+        return min(max(1, weeks_elapsed + 1), 18)
+
+
+@functools.cache
+def get_provider() -> MockNFLData:
+    """Get the shared mock NFL data provider.
+
+    The provider is created on first use, so importing this module does not
+    build it.
+
+    Returns:
+        MockNFLData: Process-wide provider instance.
+    """
+    return MockNFLData()
+
+
+def seed_nfl_teams(db: "Client") -> list[dict[str, Any]]:
+    """Insert the provider's teams into the nfl_teams table.
+
+    Args:
+        db: Supabase client for database operations.
+
+    Returns:
+        list[dict[str, Any]]: The inserted team rows, including their team_id.
+    """
+    return db.table("nfl_teams").insert(_team_rows()).execute().data
+
+
+def _team_rows() -> list[dict[str, Any]]:
+    """Build nfl_teams rows from the shared provider's teams.
+
+    Returns:
+        list[dict[str, Any]]: One active row per team, ready to insert.
+    """
+    return (
+        get_provider()
+        .import_teams()
+        .reindex(columns=_TEAM_COLUMNS)
+        .fillna({"points": 5})  # Default to 5 points if not specified
+        .astype({"points": int})
+        .assign(is_active=True)
+        .to_dict(orient="records")
+    )
@@ -0,0 +1,97 @@
+"""Cached Supabase queries shared across pages."""
+
+from typing import TYPE_CHECKING, Any
+
+import streamlit as st
+
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_profiles(_db: "Client", user_id: str) -> list[dict[str, Any]]:
+    """Load all profiles belonging to a user.
+
+    Streamlit reruns the whole script on every interaction, so the result is
+    cached per user to keep the profile lookup off the critical path. Call
+    ``load_profiles.clear(db, user_id)`` after creating or changing one of
+    the user's profiles.
+
+    Args:
+        _db: Supabase client for database operations (not hashed by Streamlit).
+        user_id: ID of the user whose profiles should be loaded.
+
+    Returns:
+        list[dict[str, Any]]: Profile rows for the user.
+    """
+    return (
+        _db.table("profiles")
+        .select("profile_id", "profile_name", "display_name", "created_at")
+        .eq("user_id", user_id)
+        .execute()
+        .data
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_user(_db: "Client", user_id: str) -> dict[str, Any]:
+    """Load the account details shown for the logged-in user.
+
+    Call ``load_user.clear()`` after changing a user's account details.
+
+    Args:
+        _db: Supabase client for database operations (not hashed by Streamlit).
+        user_id: ID of the user to load.
+
+    Returns:
+        dict[str, Any]: The user's email, name, and creation timestamp.
+    """
+    return (
+        _db.table("users")
+        .select("email", "first_name", "last_name", "created_at")
+        .eq("user_id", user_id)
+        .execute()
+        .data[0]
+    )
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_teams_by_id(_db: "Client") -> dict[str, dict[str, Any]]:
+    """Load every NFL team keyed by team ID.
+
+    The teams table is small and effectively static, so pages look teams up
+    in this dictionary instead of querying per selection.
+
+    Args:
+        _db: Supabase client for database operations (not hashed by Streamlit).
+
+    Returns:
+        dict[str, dict[str, Any]]: Team rows keyed by ``team_id``.
+    """
+    teams = _db.table("nfl_teams").select("*").execute().data
+    return {team["team_id"]: team for team in teams}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_profile_pools(_db: "Client", profile_id: str) -> list[dict[str, Any]]:
+    """Load the pools a profile has joined.
+
+    The pools are embedded in the participant query, so this is a single
+    round trip. Call ``load_profile_pools.clear(db, profile_id)`` after the
+    profile joins or creates a pool.
+
+    Args:
+        _db: Supabase client for database operations (not hashed by Streamlit).
+        profile_id: ID of the profile whose pools should be loaded.
+
+    Returns:
+        list[dict[str, Any]]: Pool rows the profile participates in.
+    """
+    participants = (
+        _db.table("pool_participants")
+        .select("pool:pools(*)")
+        .eq("profile_id", profile_id)
+        .execute()
+        .data
+    )
+    return [participant["pool"] for participant in participants if participant["pool"]]
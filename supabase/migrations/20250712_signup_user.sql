@@ -0,0 +1,34 @@
+-- Atomic account creation
+-- Creates a user and their default profile in one round trip. Returns no rows
+-- when the email is already registered.
+
+CREATE OR REPLACE FUNCTION signup_user(
+    p_email TEXT,
+    p_password_hash TEXT,
+    p_first_name TEXT,
+    p_last_name TEXT,
+    p_email_verified BOOLEAN DEFAULT false
+)
+RETURNS TABLE (user_id UUID, profile_id UUID)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_user_id UUID;
+    new_profile_id UUID;
+BEGIN
+    INSERT INTO users (email, password_hash, first_name, last_name, is_active, email_verified)
+    VALUES (p_email, p_password_hash, p_first_name, p_last_name, true, p_email_verified)
+    ON CONFLICT (email) DO NOTHING
+    RETURNING users.user_id INTO new_user_id;
+
+    IF new_user_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO profiles (user_id, profile_name, display_name)
+    VALUES (new_user_id, p_first_name || ' ' || p_last_name, p_first_name || ' ' || p_last_name)
+    RETURNING profiles.profile_id INTO new_profile_id;
+
+    RETURN QUERY SELECT new_user_id, new_profile_id;
+END;
+$$;
@@ -0,0 +1,25 @@
+-- Development data reset
+-- Clears every Family Huddle table in a single statement. Only the service
+-- role may call it; it is used by scripts/init_data.py before reseeding.
+
+CREATE OR REPLACE FUNCTION reset_family_huddle()
+RETURNS void
+LANGUAGE sql
+AS $$
+    TRUNCATE TABLE
+        pool_scores,
+        team_selections,
+        pool_participants,
+        pools,
+        profiles,
+        users,
+        team_performance,
+        nfl_games,
+        nfl_weeks,
+        nfl_seasons,
+        nfl_teams
+    RESTART IDENTITY CASCADE;
+$$;
+
+REVOKE EXECUTE ON FUNCTION reset_family_huddle() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION reset_family_huddle() TO service_role;
@@ -0,0 +1,36 @@
+-- Pool standings
+-- Ranks every pool participant by their latest total points so the leaderboard
+-- reads ready-made standings in a single query. Participants without a score
+-- rank with 0 points.
+
+CREATE OR REPLACE VIEW pool_standings
+WITH (security_invoker = true)
+AS
+SELECT
+    pp.pool_id,
+    pp.profile_id,
+    pr.display_name,
+    pp.selections_complete,
+    COALESCE(latest.total_points, 0) AS total_points,
+    RANK() OVER (
+        PARTITION BY pp.pool_id
+        ORDER BY COALESCE(latest.total_points, 0) DESC
+    ) AS rank_position,
+    teams.team_codes
+FROM pool_participants pp
+JOIN profiles pr ON pr.profile_id = pp.profile_id
+LEFT JOIN LATERAL (
+    SELECT ps.total_points
+    FROM pool_scores ps
+    WHERE ps.pool_id = pp.pool_id AND ps.profile_id = pp.profile_id
+    ORDER BY ps.created_at DESC
+    LIMIT 1
+) latest ON true
+LEFT JOIN LATERAL (
+    SELECT string_agg(t.team_code, ', ' ORDER BY ts.selection_order) AS team_codes
+    FROM team_selections ts
+    JOIN nfl_teams t ON t.team_id = ts.team_id
+    WHERE ts.pool_id = pp.pool_id AND ts.profile_id = pp.profile_id
+) teams ON true;
+
+GRANT SELECT ON pool_standings TO anon, authenticated, service_role;
@@ -0,0 +1,34 @@
+"""Tests for password hashing and verification."""
+
+import bcrypt
+
+from family_huddle.pages.auth import hash_password, verify_password
+
+
+def test_hash_password_uses_argon2id():
+    """New hashes are argon2id and salted per call."""
+    hashed = hash_password("correct horse")
+
+    assert hashed.startswith("$argon2id$")
+    assert hashed != hash_password("correct horse")
+
+
+def test_verify_argon2_password():
+    """An argon2 hash verifies the right password and rejects a wrong one."""
+    hashed = hash_password("correct horse")
+
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("battery staple", hashed)
+
+
+def test_verify_invalid_argon2_hash():
+    """A malformed argon2 hash is rejected rather than raising."""
+    assert not verify_password("correct horse", "$argon2id$not-a-real-hash")
+
+
+def test_verify_legacy_bcrypt_password():
+    """bcrypt hashes created before the switch to argon2id still verify."""
+    hashed = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+    assert verify_password("correct horse", hashed)
+    assert not verify_password("battery staple", hashed)
@@ -0,0 +1,94 @@
+"""Tests for the retrying HTTP transport behind the Supabase client."""
+
+import httpx
+import pytest
+
+from family_huddle.services import database
+from family_huddle.services.database import _RetryTransport
+
+URL = "https://example.supabase.co/rest/v1/pools"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(database.time, "sleep", delays.append)
+    return delays
+
+
+def _stub_responses(monkeypatch, *responses):
+    """Make the underlying transport return the given responses in order.
+
+    Returns:
+        list[httpx.Response]: The responses handed out so far.
+    """
+    pending = list(responses)
+    sent = []
+
+    def handle_request(self, request):
+        status_code, headers = pending.pop(0)
+        response = httpx.Response(
+            status_code, headers=headers, stream=httpx.ByteStream(b""), request=request
+        )
+        sent.append(response)
+        return response
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle_request)
+    return sent
+
+
+def test_rate_limited_post_is_retried(monkeypatch, sleeps):
+    """A 429 is retried for POST, since the server never processed it."""
+    sent = _stub_responses(monkeypatch, (429, {}), (201, {}))
+
+    response = _RetryTransport().handle_request(httpx.Request("POST", URL))
+
+    assert response.status_code == 201
+    assert len(sent) == 2
+    assert len(sleeps) == 1
+
+
+def test_server_error_on_post_is_not_retried(monkeypatch, sleeps):
+    """A 503 on POST is returned as-is so a write is never applied twice."""
+    sent = _stub_responses(monkeypatch, (503, {}))
+
+    response = _RetryTransport().handle_request(httpx.Request("POST", URL))
+
+    assert response.status_code == 503
+    assert len(sent) == 1
+    assert sleeps == []
+
+
+def test_server_error_on_get_returns_last_response(monkeypatch, sleeps):
+    """A 503 on GET is retried up to ``retries`` times, then the last response is returned."""
+    sent = _stub_responses(monkeypatch, *[(503, {})] * 4)
+
+    response = _RetryTransport(retries=3).handle_request(httpx.Request("GET", URL))
+
+    assert len(sent) == 4
+    assert len(sleeps) == 3
+    assert response is sent[-1]
+    assert response.status_code == 503
+
+
+def test_retry_after_is_capped(monkeypatch, sleeps):
+    """A numeric Retry-After header is honoured up to ``max_delay``."""
+    _stub_responses(
+        monkeypatch, (429, {"Retry-After": "2"}), (429, {"Retry-After": "120"}), (200, {})
+    )
+
+    _RetryTransport(max_delay=5.0).handle_request(httpx.Request("GET", URL))
+
+    assert sleeps == [2.0, 5.0]
+
+
+def test_discarded_responses_are_closed(monkeypatch, sleeps):
+    """Every response that is retried is closed; the returned one is left open."""
+    sent = _stub_responses(monkeypatch, (502, {}), (504, {}), (200, {}))
+
+    response = _RetryTransport().handle_request(httpx.Request("GET", URL))
+
+    assert all(discarded.is_closed for discarded in sent[:-1])
+    assert response is sent[-1]
+    assert not response.is_closed
@@ -0,0 +1,49 @@
+"""Tests for the mock NFL data provider."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from family_huddle.services.nfl_data import MockNFLData
+
+YEARS = (2025, 2026)
+
+
+@pytest.fixture(scope="module")
+def schedules():
+    """Schedules for two seasons, mid-way through the second one."""
+    return MockNFLData()._build_schedules(YEARS, date(2026, 10, 15))
+
+
+def test_schedule_row_count(schedules):
+    """Every season has 18 weeks of 16 games."""
+    assert len(schedules) == len(YEARS) * 18 * 16
+
+
+def test_every_team_plays_once_per_week(schedules):
+    """Each team appears exactly once per week and never plays itself."""
+    assert (schedules["home_team"] != schedules["away_team"]).all()
+
+    for _, games in schedules.groupby(["season", "week"]):
+        teams = pd.concat([games["home_team"], games["away_team"]])
+        assert teams.is_unique
+        assert len(teams) == 32
+
+
+def test_scores_missing_only_for_scheduled_games(schedules):
+    """Scores are <NA> exactly where the game has not been played."""
+    scheduled = schedules["game_status"] == "SCHEDULED"
+
+    assert scheduled.any() and not scheduled.all()
+    assert (schedules["home_score"].isna() == scheduled).all()
+    assert (schedules["away_score"].isna() == scheduled).all()
+
+
+def test_game_dates_fall_in_their_week(schedules):
+    """Games are played 0, 3 or 4 days after the start of their week."""
+    season_start = pd.to_datetime(schedules["season"].astype(str) + "-09-07")
+    days = (schedules["game_date"] - season_start).dt.days
+    week_start = 7 * (schedules["week"].astype(int) - 1)
+
+    assert (days - week_start).isin([0, 3, 4]).all()